@@ -13,39 +13,95 @@ from fetch_registration_details import fetch_registration_details
 DEFAULT_CAPACITY = 72
 # Percentage threshold at which to consider a tournament "filling up"
 FILLING_THRESHOLD = 75
+# How long a fetched result stays fresh for memoization (seconds)
+RESULT_TTL = 300
 
 class DetailWorker:
     """Worker class to fetch tournament details asynchronously"""
-    
-    def __init__(self, executor, max_concurrent=2):
+
+    def __init__(self, max_concurrent=2, result_ttl=RESULT_TTL):
         """
         Initialize the worker
-        
+
         Args:
-            executor: ThreadPoolExecutor to use for background tasks
             max_concurrent: Maximum number of concurrent detail requests
+            result_ttl: How long fetched results are reused without refetching
         """
-        self.executor = executor
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
-    
+        self.result_ttl = result_ttl
+        # Pending (url, future) pairs drained by a fixed pool of workers.
+        # Unlike a semaphore, the pool admits work one request at a time,
+        # which paces cleanly with the RateLimiter instead of bursting.
+        self.queue = asyncio.Queue()
+        self._workers = []
+        # In-flight futures by URL, so duplicate URLs share one request
+        self._inflight = {}
+        # Recently completed results by URL: (fetched_at, details)
+        self._recent = {}
+
     async def get_tournament_details(self, tournament):
         """
         Fetch additional details for a tournament asynchronously
-        
+
+        Duplicate URLs within a pass share a single in-flight request, and
+        results are reused for a short TTL across back-to-back passes.
+
         Args:
             tournament: Tournament dictionary with at least a URL field
-        
+
         Returns:
             Dictionary with additional tournament details
         """
-        async with self.semaphore:
-            loop = asyncio.get_running_loop()
-            details = await loop.run_in_executor(
-                self.executor, 
-                lambda: fetch_registration_details(tournament["url"])
-            )
+        url = tournament["url"]
+
+        # Reuse a recent result if it's still fresh
+        recent = self._recent.get(url)
+        if recent and time.time() - recent[0] < self.result_ttl:
+            logging.debug(f"Reusing recent details for {url}")
+            return recent[1]
+
+        # Join an in-flight request for the same URL instead of duplicating it
+        future = self._inflight.get(url)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_details(url))
+            self._inflight[url] = future
+            try:
+                details = await future
+            finally:
+                self._inflight.pop(url, None)
+            self._recent[url] = (time.time(), details)
             return details
+
+        return await future
+
+    def _ensure_workers(self):
+        """Spawn the worker pool on first use so it binds to the running loop"""
+        if not self._workers:
+            self._workers = [
+                asyncio.ensure_future(self._worker())
+                for _ in range(self.max_concurrent)
+            ]
+
+    async def _worker(self):
+        """Drain the queue, fulfilling one detail request at a time"""
+        while True:
+            url, future = await self.queue.get()
+            try:
+                result = await fetch_registration_details(url)
+                if not future.cancelled():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                self.queue.task_done()
+
+    async def _fetch_details(self, url):
+        """Queue a detail fetch and wait for a pool worker to complete it"""
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((url, future))
+        return await future
     
     async def enrich_tournaments(self, tournaments):
         """
@@ -59,83 +115,104 @@ class DetailWorker:
         """
         closing_soon = []
         filling_up = []
-        
+
         # First pre-filter tournaments that need details
         eligible_tournaments = []
-        
+
+        # Hoisted out of the loop; per-tournament drift is irrelevant here
+        now = datetime.now()
+
         for tournament in tournaments:
             should_check_closing = False
             should_check_filling = False
-            
+
+            # Cheap flag checks first - if both notifications have already
+            # been sent there's nothing to do, skip the date parse entirely
+            closing_sent = tournament.get("registration_closing_sent", False)
+            filling_sent = tournament.get("registration_filling_sent", False)
+            if closing_sent and filling_sent:
+                continue
+
             # Check if we should check for closing soon
-            try:
-                if tournament["date"] != "N/A":
-                    date_obj = datetime.strptime(tournament["date"], "%m/%d/%Y")
-                    days_until_tournament = (date_obj - datetime.now()).days
-                    should_check_closing = days_until_tournament <= 14 and not tournament.get("registration_closing_sent", False)
-            except (ValueError, TypeError) as e:
-                logging.warning(f"Date parsing error for {tournament['name']}: {e}")
-            
+            if not closing_sent:
+                try:
+                    # Prefer the datetime the scraper already parsed
+                    date_obj = tournament.get("_date_obj")
+                    if date_obj is None and tournament["date"] != "N/A":
+                        # Hand-rolled m/d/Y parse; strptime is far slower
+                        month, day, year = tournament["date"].split("/")
+                        date_obj = datetime(int(year), int(month), int(day))
+                    if date_obj is not None:
+                        days_until_tournament = (date_obj - now).days
+                        should_check_closing = days_until_tournament <= 14
+                except (ValueError, TypeError) as e:
+                    logging.warning(f"Date parsing error for {tournament['name']}: {e}")
+
             # Check if there are enough registrants to potentially be "filling up"
             # Use either the actual capacity or DEFAULT_CAPACITY
             tournament_capacity = tournament.get("capacity", 0) or DEFAULT_CAPACITY
             fill_percentage = (tournament["registrants"] / tournament_capacity) * 100 if tournament_capacity > 0 else 0
-            
+
             # If it's already at least 50% full, we should check it
-            should_check_filling = fill_percentage >= 50 and not tournament.get("registration_filling_sent", False)
+            should_check_filling = fill_percentage >= 50 and not filling_sent
             
             # Only fetch details when needed and registration is open
             if tournament["url"] != "N/A" and tournament.get("registration_open", True) and (should_check_closing or should_check_filling):
                 eligible_tournaments.append((tournament, should_check_closing, should_check_filling))
         
-        # Process eligible tournaments in batches to avoid overwhelming the server
-        batch_size = 5
-        for i in range(0, len(eligible_tournaments), batch_size):
-            batch = eligible_tournaments[i:i+batch_size]
-            tasks = []
-            
-            # Create tasks for this batch
-            for tournament, check_closing, check_filling in batch:
-                tasks.append((tournament, check_closing, check_filling, self.get_tournament_details(tournament)))
-            
-            # Wait a moment between batches to avoid rate limiting
-            if i > 0:
-                await asyncio.sleep(2.0)
-            
-            # Process results as they complete
-            for tournament, check_closing, check_filling, task in tasks:
-                try:
-                    details = await task
-                    tournament.update(details)  # Add fetched details to the tournament dictionary
-                    
-                    # Check for "closing soon"
-                    if check_closing and details["closing_date"]:
-                        days_left = (details["closing_date"] - datetime.now()).days
-                        if days_left < 7:
-                            closing_soon.append(tournament)
-                            tournament["registration_closing_sent"] = True
-                    
-                    # Check for "filling up"
-                    if check_filling:
-                        # Use either the fetched capacity or the capacity from the listing, or DEFAULT_CAPACITY
-                        capacity = details.get("capacity", tournament.get("capacity", 0)) or DEFAULT_CAPACITY
-                        
-                        # Use the larger of the registrant counts
-                        registrants = max(details.get("registrants", 0), tournament.get("registrants", 0))
-                        
-                        # Calculate percentage and check if it's filling up
-                        if capacity > 0:  # Avoid division by zero
-                            fill_percentage = (registrants / capacity) * 100
-                            if fill_percentage >= FILLING_THRESHOLD:
-                                # Update the tournament with the latest numbers
-                                tournament["registrants"] = registrants
-                                tournament["capacity"] = capacity
-                                filling_up.append(tournament)
-                                tournament["registration_filling_sent"] = True
-                                logging.info(f"Tournament filling up: {tournament['name']} - {registrants}/{capacity} ({fill_percentage:.1f}%)")
-                
-                except Exception as e:
-                    logging.error(f"Error processing details for {tournament['name']}: {e}")
+        # Submit every eligible tournament at once; the worker pool and the
+        # rate limiter pace the actual requests, so explicit batching with
+        # sleeps between batches only added idle wall-clock time
+        async def fetch_with_meta(tournament, check_closing, check_filling):
+            try:
+                details = await self.get_tournament_details(tournament)
+            except Exception as e:
+                logging.error(f"Error fetching details for {tournament['name']}: {e}")
+                details = None
+            return tournament, check_closing, check_filling, details
+
+        futures = [
+            asyncio.ensure_future(fetch_with_meta(tournament, check_closing, check_filling))
+            for tournament, check_closing, check_filling in eligible_tournaments
+        ]
+
+        # Process results as they complete rather than in submission order,
+        # so one slow fetch doesn't hold up bookkeeping for the others
+        for future in asyncio.as_completed(futures):
+            try:
+                tournament, check_closing, check_filling, details = await future
+                if details is None:
+                    continue  # Fetch failed; already logged by fetch_with_meta
+                tournament.update(details)  # Add fetched details to the tournament dictionary
+
+                # Check for "closing soon"
+                if check_closing and details["closing_date"]:
+                    days_left = (details["closing_date"] - datetime.now()).days
+                    if days_left < 7:
+                        closing_soon.append(tournament)
+                        tournament["registration_closing_sent"] = True
+
+                # Check for "filling up"
+                if check_filling:
+                    # Use either the fetched capacity or the capacity from the listing, or DEFAULT_CAPACITY
+                    capacity = details.get("capacity", tournament.get("capacity", 0)) or DEFAULT_CAPACITY
+
+                    # Use the larger of the registrant counts
+                    registrants = max(details.get("registrants", 0), tournament.get("registrants", 0))
+
+                    # Calculate percentage and check if it's filling up
+                    if capacity > 0:  # Avoid division by zero
+                        fill_percentage = (registrants / capacity) * 100
+                        if fill_percentage >= FILLING_THRESHOLD:
+                            # Update the tournament with the latest numbers
+                            tournament["registrants"] = registrants
+                            tournament["capacity"] = capacity
+                            filling_up.append(tournament)
+                            tournament["registration_filling_sent"] = True
+                            logging.info(f"Tournament filling up: {tournament['name']} - {registrants}/{capacity} ({fill_percentage:.1f}%)")
+
+            except Exception as e:
+                logging.error(f"Error processing details for {tournament['name']}: {e}")
         
         logging.info(f"Processed details for {len(eligible_tournaments)} tournaments, found {len(closing_soon)} closing soon and {len(filling_up)} filling up")
         return closing_soon, filling_up
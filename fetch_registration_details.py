@@ -1,134 +1,286 @@
-import requests
+import aiohttp
+import asyncio
+import shelve
+import soupsieve
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
-import time
 import random
-from rate_limit_helper import RateLimiter
+from functools import lru_cache
+from itertools import cycle
+from rate_limit_helper import AsyncRateLimiter
 
 # Create a rate limiter instance to limit requests to tournament pages
-rate_limiter = RateLimiter(requests_per_minute=10)
+rate_limiter = AsyncRateLimiter(requests_per_minute=10)
 
-def fetch_registration_details(url):
+# Rotate through a fixed set of browser user agents instead of building
+# the list (and re-allocating its strings) on every request
+USER_AGENTS = cycle((
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0',
+))
+
+# Static header fields shared by every detail request; the per-request
+# User-Agent is layered on top
+BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0',
+    # Add a realistic referer to seem like we're coming from the search page
+    'Referer': 'https://www.discgolfscene.com/tournaments/search',
+}
+
+# Selectors precompiled at import time so each parse skips soupsieve's
+# pattern-compilation path entirely
+CUTOFF_SELECTOR = soupsieve.compile("div.cutoff span")
+REGISTERED_PLAYERS_SELECTOR = soupsieve.compile('a:-soup-contains("Registered Players")')
+REGISTRATION_SECTION_SELECTOR = soupsieve.compile(".registration-section")
+REGISTRANTS_SELECTOR = soupsieve.compile(".registrants")
+
+# Everything we parse out of a detail page sits well above the footer, so
+# stop reading the body once we see it (or hit the size cap) instead of
+# materializing hundreds of KB of HTML we never look at
+BODY_CHUNK_SIZE = 16384
+BODY_SENTINEL = b"</footer>"
+MAX_BODY_BYTES = 128 * 1024
+
+# Transient failures worth retrying rather than reporting zeros and
+# waiting a whole poll cycle for fresh data
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_FETCH_ATTEMPTS = 3
+
+# On-disk cache of parsed details keyed by URL. Tournament pages change
+# slowly, so honoring ETag/Last-Modified lets us skip the download and
+# the BeautifulSoup parse entirely when the server answers 304.
+DETAILS_CACHE_FILE = "details_cache"
+
+@lru_cache(maxsize=4096)
+def parse_closing_date(date_part):
+    """Parse a 'January 23, 2025' style date, memoized across poll cycles
+
+    The same closing dates come back every cycle, so caching skips the
+    (slow) strptime call on repeat pages.
+    """
+    return datetime.strptime(date_part, "%B %d, %Y")
+
+def extract_closing_info(soup):
+    """Extract the registration closing text and date from a detail page"""
+    cutoff_div = CUTOFF_SELECTOR.select_one(soup)
+    closing_date = None
+    closing_text = "N/A"
+    if cutoff_div:
+        closing_text = cutoff_div.text.strip()
+        try:
+            # Extract date from text like "Online registration closes January 23, 2025 at 6:00pm EST"
+            if "closes " in closing_text:
+                date_part = closing_text.split("closes ")[1].split(" at")[0]
+                closing_date = parse_closing_date(date_part)
+                # remove "online registration closes" from closing_text
+                if "Online registration closes " in closing_text:
+                    closing_text = closing_text.split("Online registration closes ")[1]
+            elif "closed" in closing_text.lower():
+                # Handle case where registration is already closed
+                closing_text = "Registration closed"
+        except (IndexError, ValueError) as e:
+            logging.warning(f"Failed to parse closing date from '{closing_text}': {e}")
+            closing_date = None  # Handle invalid or missing date format
+    return closing_text, closing_date
+
+def extract_counts_from_players_link(registered_link):
+    """Extract registrants/capacity from the Registered Players link variant"""
+    registrants = 0
+    capacity = 0
+    try:
+        # Extract numbers from "80 / 216" in the span text
+        reg_span = registered_link.find("span")
+        if reg_span:
+            registered_text = reg_span.text.strip()
+            if " / " in registered_text:
+                registrants, capacity = map(int, registered_text.split(" / "))
+            elif registered_text.isdigit():
+                registrants = int(registered_text)
+    except (AttributeError, ValueError, IndexError) as e:
+        logging.warning(f"Failed to parse registrants/capacity from registered players link: {e}")
+    return registrants, capacity
+
+def extract_counts_from_registration_section(soup):
+    """Extract registrants/capacity from the registration-section variant"""
+    registrants = 0
+    capacity = 0
+    reg_section = REGISTRATION_SECTION_SELECTOR.select_one(soup)
+    if reg_section:
+        try:
+            reg_span = REGISTRANTS_SELECTOR.select_one(reg_section)
+            if reg_span:
+                reg_text = reg_span.text.strip()
+                if "Players:" in reg_text:
+                    reg_text = reg_text.split("Players:")[1].strip()
+                    if "/" in reg_text:
+                        registrants, capacity = map(int, reg_text.split("/"))
+                    elif reg_text.isdigit():
+                        registrants = int(reg_text)
+        except (AttributeError, ValueError, IndexError) as e:
+            logging.warning(f"Failed to parse registrants/capacity from registration section: {e}")
+    return registrants, capacity
+
+def parse_registration_details(html):
+    """Parse a detail page into the registration details dict
+
+    Probes once for the common page variant (the Registered Players link)
+    and dispatches to the extractor for that variant, so the fallback DOM
+    walk only happens on pages that actually need it.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    closing_text, closing_date = extract_closing_info(soup)
+
+    registered_link = REGISTERED_PLAYERS_SELECTOR.select_one(soup)
+    if registered_link is not None:
+        registrants, capacity = extract_counts_from_players_link(registered_link)
+    else:
+        registrants, capacity = extract_counts_from_registration_section(soup)
+
+    return {
+        "closing_text": closing_text,
+        "closing_date": closing_date,
+        "registrants": registrants,
+        "capacity": capacity
+    }
+
+def load_cached_details(url):
+    """Return the cached (etag, last_modified, details) for a URL, if any"""
+    try:
+        with shelve.open(DETAILS_CACHE_FILE) as cache:
+            return cache.get(url)
+    except Exception as e:
+        logging.warning(f"Failed to read details cache: {e}")
+        return None
+
+def store_cached_details(url, etag, last_modified, details):
+    """Persist the validators and parsed details for a URL"""
+    try:
+        with shelve.open(DETAILS_CACHE_FILE) as cache:
+            cache[url] = (etag, last_modified, details)
+    except Exception as e:
+        logging.warning(f"Failed to write details cache: {e}")
+
+# Shared aiohttp session, created lazily so it binds to the running event loop.
+# The connector limit is the real concurrency cap for detail requests.
+_session = None
+
+async def get_session():
+    """Return the shared aiohttp session, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=3,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    return _session
+
+def _backoff_delay(attempt, retry_after=None):
+    """Exponential backoff with jitter, honoring a Retry-After header"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(2 ** (attempt - 1), 10) + random.uniform(0, 1)
+
+async def _get_with_retry(session, url, headers):
+    """GET a detail page, retrying transient failures with backoff
+
+    Returns (status, response_headers, body). Retryable statuses and
+    connection errors are retried up to MAX_FETCH_ATTEMPTS; the last
+    failure is returned (or raised) as-is.
+    """
+    for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
+        try:
+            async with session.get(url, headers=headers) as response:
+                status = response.status
+                if status in RETRY_STATUSES and attempt < MAX_FETCH_ATTEMPTS:
+                    delay = _backoff_delay(attempt, response.headers.get('Retry-After'))
+                    logging.warning(f"Got status {status} from {url}, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+                if status != 200:
+                    return status, response.headers, b""
+
+                # Stream the body and stop early once we have the fragment we need
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if BODY_SENTINEL in chunk or len(body) >= MAX_BODY_BYTES:
+                        break
+                return status, response.headers, bytes(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt >= MAX_FETCH_ATTEMPTS:
+                raise
+            delay = _backoff_delay(attempt)
+            logging.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+async def fetch_registration_details(url):
     """
     Fetch tournament registration details with rate limiting
-    
+
     This function uses a rate limiter to avoid being blocked by the website.
     """
     # Wait if needed to respect the rate limit
-    rate_limiter.wait_if_needed()
-    
+    await rate_limiter.wait_if_needed()
+
     try:
-        # Add a random user agent to seem more like a real browser
-        headers = {
-            'User-Agent': random.choice([
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0'
-            ]),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0',
-            # Add a realistic referer to seem like we're coming from the search page
-            'Referer': 'https://www.discgolfscene.com/tournaments/search',
-        }
-        
-        # Add randomized timing - sometimes we check links right away, sometimes we delay
-        # This makes our behavior seem more human-like
-        if random.random() < 0.3:  # 30% chance of a longer delay
-            delay = random.uniform(2, 5)
-            logging.debug(f"Adding extra pre-request delay of {delay:.2f}s for {url}")
-            time.sleep(delay)
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        
-        # Add a small delay after the request - randomized to seem more human
-        time.sleep(random.uniform(0.5, 2))
-        
+        # Rotate the user agent to seem more like a real browser
+        headers = {**BASE_HEADERS, 'User-Agent': next(USER_AGENTS)}
+
+        # Attach cache validators so unchanged pages come back as a 304
+        cached = await asyncio.to_thread(load_cached_details, url)
+        if cached:
+            etag, last_modified, cached_details = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        session = await get_session()
+        status, response_headers, html = await _get_with_retry(session, url, headers)
+
+        if status == 304:
+            logging.debug(f"Details unchanged for {url}, using cached result")
+            return cached_details
+
+        response_etag = response_headers.get('ETag')
+        response_last_modified = response_headers.get('Last-Modified')
+
         # Check if we got a successful response
-        if response.status_code != 200:
-            logging.warning(f"Got status code {response.status_code} from {url}")
+        if status != 200:
+            logging.warning(f"Got status code {status} from {url}")
             return {
                 "closing_text": "N/A",
                 "closing_date": None,
                 "registrants": 0,
                 "capacity": 0
             }
-            
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Extract registration closing date
-        cutoff_div = soup.select_one("div.cutoff span")
-        closing_date = None
-        closing_text = "N/A"
-        if cutoff_div:
-            closing_text = cutoff_div.text.strip()
-            try:
-                # Extract date from text like "Online registration closes January 23, 2025 at 6:00pm EST"
-                if "closes " in closing_text:
-                    date_part = closing_text.split("closes ")[1].split(" at")[0]
-                    closing_date = datetime.strptime(date_part, "%B %d, %Y")
-                    # remove "online registration closes" from closing_text
-                    if "Online registration closes " in closing_text:
-                        closing_text = closing_text.split("Online registration closes ")[1]
-                elif "closed" in closing_text.lower():
-                    # Handle case where registration is already closed
-                    closing_text = "Registration closed"
-            except (IndexError, ValueError) as e:
-                logging.warning(f"Failed to parse closing date from '{closing_text}': {e}")
-                closing_date = None  # Handle invalid or missing date format
-
-        # Extract registrants and capacity
-        registrants = 0
-        capacity = 0
-        
-        # Try first with the registered players link
-        registered_span = soup.find("a", string=lambda x: x and "Registered Players" in x)
-        if registered_span:
-            try:
-                # Extract numbers from "80 / 216" in the span text
-                reg_span = registered_span.find("span")
-                if reg_span:
-                    registered_text = reg_span.text.strip()
-                    if " / " in registered_text:
-                        registrants, capacity = map(int, registered_text.split(" / "))
-                    elif registered_text.isdigit():
-                        registrants = int(registered_text)
-            except (AttributeError, ValueError, IndexError) as e:
-                logging.warning(f"Failed to parse registrants/capacity from registered players link: {e}")
-        
-        # If not found, try with the registration section
-        if registrants == 0 and capacity == 0:
-            reg_section = soup.select_one(".registration-section")
-            if reg_section:
-                try:
-                    reg_span = reg_section.select_one(".registrants")
-                    if reg_span:
-                        reg_text = reg_span.text.strip()
-                        if "Players:" in reg_text:
-                            reg_text = reg_text.split("Players:")[1].strip()
-                            if "/" in reg_text:
-                                registrants, capacity = map(int, reg_text.split("/"))
-                            elif reg_text.isdigit():
-                                registrants = int(reg_text)
-                except (AttributeError, ValueError, IndexError) as e:
-                    logging.warning(f"Failed to parse registrants/capacity from registration section: {e}")
-
-        # After processing, occasionally add a longer delay to avoid detection patterns
-        if random.random() < 0.2:  # 20% chance of a post-processing delay
-            delay = random.uniform(1, 3)
-            logging.debug(f"Adding post-processing delay of {delay:.2f}s")
-            time.sleep(delay)
 
-        return {
-            "closing_text": closing_text,
-            "closing_date": closing_date,
-            "registrants": registrants,
-            "capacity": capacity 
-        }
+        details = parse_registration_details(html)
+
+        # Remember the validators and parsed result for the next poll cycle
+        if response_etag or response_last_modified:
+            await asyncio.to_thread(
+                store_cached_details, url, response_etag, response_last_modified, details
+            )
+
+        return details
     except Exception as e:
         logging.error(f"Error fetching tournament details: {e}")
         return {
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import random
 import logging
@@ -36,10 +37,43 @@ class RateLimiter:
         """Wait if we're making requests too quickly"""
         current_time = time.time()
         elapsed = current_time - self.last_request_time
-        
-        if elapsed < self.min_interval:
-            wait_time = self.min_interval - elapsed
+
+        # Jitter the interval slightly so request timing isn't perfectly regular
+        interval = self.min_interval * random.uniform(0.9, 1.1)
+        if elapsed < interval:
+            wait_time = interval - elapsed
             logging.info(f"Rate limiting: Waiting {wait_time:.2f}s to respect rate limit")
             time.sleep(wait_time)
-            
+
         self.last_request_time = time.time()
+
+class AsyncRateLimiter:
+    """Coroutine-safe rate limiter for pacing requests on the event loop
+
+    The sync RateLimiter races when called from several coroutines: both
+    read the old last_request_time and proceed together. Here the check,
+    sleep and timestamp update happen under an asyncio.Condition, so
+    concurrent callers are admitted one interval apart.
+    """
+
+    def __init__(self, requests_per_minute=10):
+        self.requests_per_minute = requests_per_minute
+        self.min_interval = 60 / requests_per_minute
+        self.last_request_time = 0
+        self._cond = None  # created lazily so it binds to the running loop
+
+    async def wait_if_needed(self):
+        """Wait if we're making requests too quickly"""
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+
+        async with self._cond:
+            # Jitter the interval slightly so request timing isn't perfectly regular
+            interval = self.min_interval * random.uniform(0.9, 1.1)
+            wait_time = self.last_request_time + interval - time.time()
+            if wait_time > 0:
+                logging.info(f"Rate limiting: Waiting {wait_time:.2f}s to respect rate limit")
+                await asyncio.sleep(wait_time)
+
+            self.last_request_time = time.time()
+            self._cond.notify_all()
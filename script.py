@@ -2,13 +2,23 @@ import os
 import discord
 from discord.ext import tasks
 from dotenv import load_dotenv
-import requests
-from bs4 import BeautifulSoup
+import re
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+import gzip
+import hashlib
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime, timedelta
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
+import logging.handlers
+import queue
 import sys
 from pytz import timezone
 from selenium import webdriver
@@ -17,30 +27,52 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 import random
 import asyncio
-import concurrent.futures
+import threading
 from detail_worker import DetailWorker
+from fetch_registration_details import get_session
 import platform
 import subprocess
 
+# Swap in the libuv event loop when available (Linux/macOS; matches the
+# Render deploy). Lower scheduling latency helps the gateway heartbeat
+# stay on time while scrape work is in flight.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Add these rate limiting constants
-REQUEST_COOLDOWN_MIN = 1  # Reduced minimum delay to avoid heartbeat timeouts
-REQUEST_COOLDOWN_MAX = 3  # Reduced maximum delay to avoid heartbeat timeouts 
 PAGE_LOAD_WAIT = 3        # Reduced wait time to avoid heartbeat timeouts
 MAX_PAGINATION_PAGES = 2  # Maximum number of "load more" pages to request
 
-# Configure logging
+# Configure logging. Records go through a queue so formatting and the
+# stdout/file writes happen on a background thread - the scrape path
+# logs heavily and shouldn't stall on disk I/O, nor should the event
+# loop thread.
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),  # Send logs to standard output
+    logging.FileHandler("bot.log", encoding="utf-8")  # Optional: Save logs to a file
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
 logging.basicConfig(
     level=logging.INFO,  # Set the minimum log level to INFO
-    format="%(asctime)s - %(levelname)s - %(message)s",  # Log format with timestamp
-    handlers=[
-        logging.StreamHandler(sys.stdout),  # Send logs to standard output
-        logging.FileHandler("bot.log", encoding="utf-8")  # Optional: Save logs to a file
-    ]
+    # Message-only here; the listener's handlers apply the real format.
+    # (Without this, basicConfig gives the queue handler the default
+    # "level:name:" format and records get formatted twice.)
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
 
 # Load environment variables
 load_dotenv()
@@ -51,8 +83,20 @@ CHANNEL_ID = int(os.getenv('DISCORD_CHANNEL_ID'))  # Discord channel ID as integ
 S3_BUCKET_NAME = "discord-bot-public-files"
 S3_FILE_KEY = "tournaments.json"
 
-# Initialize S3 client
-s3 = boto3.client('s3')
+# Initialize S3 client with a pinned region and a tuned connection pool
+# so every get_object/put_object reuses a warm HTTPS connection instead
+# of paying a TLS handshake and region lookup per call
+s3 = boto3.client(
+    's3',
+    region_name=os.getenv('AWS_REGION', 'us-east-1'),
+    config=Config(
+        max_pool_connections=32,
+        retries={'max_attempts': 3, 'mode': 'standard'},
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=10
+    )
+)
 
 # Discord client
 intents = discord.Intents.default()
@@ -73,6 +117,18 @@ def setup_webdriver():
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36")
+    # We only read the DOM, so skip images (both belt and suspenders -
+    # the pref and the blink flag cover different Chrome versions) and
+    # suppress Chrome's background chatter. CSS stays on because the
+    # filter form's show/hide logic depends on element visibility.
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
     
     # Environment detection for browser binary
     is_render = "RENDER" in os.environ
@@ -110,7 +166,7 @@ def setup_webdriver():
     
     try:
         driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()), 
+            service=Service(_chromedriver_path()),
             options=chrome_options
         )
         return driver
@@ -119,142 +175,310 @@ def setup_webdriver():
         logging.info("Falling back to direct HTML scraping method...")
         return None
 
+# Share one headless Chrome across fetch cycles. Spawning Chrome plus
+# resolving chromedriver is seconds of startup per run, so the driver is
+# created lazily, kept for the life of the bot, and only replaced when
+# its session dies. fetch_tournaments runs on the thread pool, hence the
+# threading lock rather than an asyncio one.
+_driver = None
+_driver_path = None
+_driver_lock = threading.Lock()
+
+def _chromedriver_path():
+    """Resolve the chromedriver binary once and reuse the path
+
+    A pinned CHROMEDRIVER_PATH skips webdriver-manager's version check
+    (an HTTPS round-trip to the Chrome-for-Testing endpoints) entirely.
+    """
+    global _driver_path
+    if _driver_path is None:
+        _driver_path = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+    return _driver_path
+
+def get_driver():
+    """Return the shared webdriver, recreating it if the session died"""
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            try:
+                # Cheap liveness probe; raises once Chrome has gone away
+                _driver.execute_script("return 1")
+                # Reset per-run state so cycles don't leak cookies
+                _driver.delete_all_cookies()
+                return _driver
+            except WebDriverException as e:
+                logging.info(f"Cached webdriver session died ({e}), recreating it")
+                try:
+                    _driver.quit()
+                except Exception:
+                    pass
+                _driver = None
+        _driver = setup_webdriver()
+        return _driver
+
+def discard_driver():
+    """Quit and drop the shared webdriver so the next run starts fresh"""
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            try:
+                _driver.quit()
+            except Exception:
+                pass
+            _driver = None
+
+# In-memory copy of the saved tournaments plus the S3 object's ETag, so
+# steady-state ticks can revalidate with If-None-Match instead of
+# re-downloading and re-parsing an unchanged blob
+_cached_tournaments = None
+_cached_etag = None
+
 def load_tournaments_from_s3():
-    """Load tournaments list from S3"""
+    """Load tournaments list from S3, revalidating the in-memory cache"""
+    global _cached_tournaments, _cached_etag
     try:
-        response = s3.get_object(Bucket=S3_BUCKET_NAME, Key=S3_FILE_KEY)
-        content = response['Body'].read().decode('utf-8')
-        return json.loads(content)
+        get_kwargs = {"Bucket": S3_BUCKET_NAME, "Key": S3_FILE_KEY}
+        if _cached_etag:
+            get_kwargs["IfNoneMatch"] = _cached_etag
+        response = s3.get_object(**get_kwargs)
+        # Content-Length is known up front, so stream the body into a
+        # pre-sized buffer instead of letting .read() grow one repeatedly
+        content_length = int(response.get('ContentLength', 0))
+        if content_length > 0:
+            content = bytearray(content_length)
+            view = memoryview(content)
+            offset = 0
+            for chunk in response['Body'].iter_chunks(64 * 1024):
+                view[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+        else:
+            content = response['Body'].read()
+        # New writes are gzipped; sniff the magic bytes so a state blob
+        # written before compression landed still loads
+        if content[:2] == b'\x1f\x8b':
+            content = gzip.decompress(content)
+        # orjson decodes straight from bytes; stdlib json needs the str hop
+        if orjson is not None:
+            _cached_tournaments = orjson.loads(content)
+        else:
+            _cached_tournaments = json.loads(content.decode('utf-8'))
+        _cached_etag = response.get('ETag')
+        return _cached_tournaments
     except ClientError as e:
-        if e.response['Error']['Code'] == 'NoSuchKey':
+        error_code = e.response['Error']['Code']
+        if error_code in ('304', 'NotModified'):
+            logging.info("Tournaments file unchanged in S3, using cached copy")
+            return _cached_tournaments
+        elif error_code == 'NoSuchKey':
             logging.error("No tournaments file found in S3. Initializing empty list.")
             return []  # If file doesn't exist, return an empty list
         else:
             logging.error(f"Error accessing S3: {e}")
             return []
 
-# Use an executor for running synchronous code in background without blocking Discord
-thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)  # Increased to 2 workers
+# Single process-wide detail worker so overlapping check cycles share
+# in-flight detail fetches and recently cached results
+detail_worker = DetailWorker(max_concurrent=2)
+
+# Serialize scrape cycles: if a tick ever overlaps a slow predecessor,
+# the second waits instead of spawning a competing Chrome session
+_scrape_lock = asyncio.Lock()
 
 async def fetch_tournaments_async():
     """Async wrapper for fetch_tournaments to avoid blocking Discord heartbeat"""
-    loop = asyncio.get_running_loop()
-    try:
-        # First try using Selenium
-        tournaments = await loop.run_in_executor(thread_pool, fetch_tournaments)
-        if tournaments:
-            return tournaments
-            
-        # If Selenium failed or returned no tournaments, try fallback method
-        logging.info("Switching to fallback HTML scraping method")
-        return await loop.run_in_executor(thread_pool, fetch_tournaments_fallback)
-    except Exception as e:
-        logging.error(f"Error fetching tournaments: {e}")
-        return []
+    async with _scrape_lock:
+        try:
+            # Plain HTTP first: the site accepts the direct form POST, so
+            # most cycles never need a browser at all. Selenium stays as
+            # the escalation path in case the search ever grows a JS gate.
+            tournaments = await fetch_tournaments_fallback()
+            if tournaments:
+                return tournaments
 
-def fetch_tournaments_fallback():
+            logging.info("HTTP fetch returned no tournaments, escalating to Selenium")
+            return await asyncio.to_thread(fetch_tournaments)
+        except Exception as e:
+            logging.error(f"Error fetching tournaments: {e}")
+            return []
+
+# Cache validators and parsed results for the paginated listing GETs.
+# When a page comes back 304 we skip both the download and the
+# BeautifulSoup parse and reuse the previous tick's tournaments.
+# (The first results page arrives via the search-form POST, so
+# conditional requests only apply to the pagination pages.)
+_page_validators = {}
+_page_results = {}
+
+# Search coordinates for Echelon, NJ, shared by the Selenium form fill
+# and the fallback POST
+SEARCH_LATITUDE = '39.846520'
+SEARCH_LONGITUDE = '-74.960981'
+
+# Browser-like headers for the fallback scraper, built once instead of
+# per call. Compressed transfer cuts the listing HTML payload
+# several-fold; aiohttp decompresses for us.
+FALLBACK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Search-form parameters for the fallback POST; static per deployment
+SEARCH_FORM_DATA = {
+    'filter_tournaments_country': 'USA',
+    'filter_usa_state': '',  # Any state
+    'filter_location_name': ZIP_CODE,
+    'filter_location_zip': ZIP_CODE,
+    'filter_location_latitude': SEARCH_LATITUDE,
+    'filter_location_longitude': SEARCH_LONGITUDE,
+    'filter_location_distance': SEARCH_DISTANCE,
+    'date_range': '0',  # All upcoming
+    'tournament_formats[]': '',  # Any format
+    'types[]': '',  # Any event type
+}
+
+async def fetch_tournaments_fallback():
     """
-    Fallback method to fetch tournaments using direct HTTP requests instead of Selenium.
-    This is used when the webdriver setup fails.
+    Fetch tournaments using direct HTTP requests instead of Selenium.
+    This is the preferred path; the Selenium scraper is the escalation
+    when it comes back empty. Runs natively on the event loop via the
+    shared aiohttp session, so Discord heartbeats keep flowing.
     """
     logging.info("Using fallback tournament fetch method")
     tournaments = []
-    
+
     try:
-        # First make a request to the search page to get any necessary cookies
-        session = requests.Session()
-        
-        # Add headers to mimic a browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0',
-        }
-        
-        # First get the search page
+        # The shared session keeps cookies and connections alive across calls
+        session = await get_session()
+
+        headers = FALLBACK_HEADERS
+
+        # First get the search page to pick up any necessary cookies
         logging.info("Accessing tournament search page")
-        search_page = session.get(TOURNAMENT_SEARCH_URL, headers=headers)
-        
+        async with session.get(TOURNAMENT_SEARCH_URL, headers=headers) as search_page:
+            await search_page.read()
+
         # Now access the filter page
         logging.info("Accessing filter page")
         filter_url = "https://www.discgolfscene.com/tournaments/search-filter"
-        filter_page = session.get(filter_url, headers=headers)
-        
+        async with session.get(filter_url, headers=headers) as filter_page:
+            await filter_page.read()
+
         # Now submit the search form with our parameters
         logging.info("Submitting search form")
-        form_data = {
-            'filter_tournaments_country': 'USA',
-            'filter_usa_state': '',  # Any state
-            'filter_location_name': ZIP_CODE,
-            'filter_location_zip': ZIP_CODE,
-            'filter_location_latitude': '39.846520',  # Echelon, NJ coordinates
-            'filter_location_longitude': '-74.960981',
-            'filter_location_distance': SEARCH_DISTANCE,
-            'date_range': '0',  # All upcoming
-            'tournament_formats[]': '',  # Any format
-            'types[]': '',  # Any event type
-        }
-        
-        response = session.post(filter_url, data=form_data, headers=headers)
-        
-        if response.status_code == 200:
+
+        # Keep the payload as bytes; lxml sniffs the charset in C, which
+        # skips aiohttp's Python-level decode of the whole page
+        async with session.post(filter_url, data=SEARCH_FORM_DATA, headers=headers) as response:
+            status = response.status
+            response_body = await response.read()
+
+        if status == 200:
             logging.info("Search form submitted successfully")
             # Parse the initial page of results
-            initial_tournaments = parse_tournament_page(response.text)
+            initial_tournaments = parse_tournament_page(response_body)
             tournaments.extend(initial_tournaments)
-            
-            # Now try to load more results
-            for page in range(1, MAX_PAGINATION_PAGES + 1):
-                logging.info(f"Fetching additional page {page} of tournaments")
+
+            # The pagination pages are independent GETs on the same
+            # pooled keep-alive connection, so fetch them concurrently
+            # instead of serially with sleeps in between
+            async def fetch_page(page):
                 more_url = f"https://www.discgolfscene.com/tournaments/search-results?limit=50,{50*page}"
-                
-                # Add a small delay to avoid overwhelming the server
-                time.sleep(random.uniform(1.5, 3.0))
-                
-                more_response = session.get(more_url, headers=headers)
-                if more_response.status_code == 200:
-                    more_tournaments = parse_tournament_page(more_response.text, len(tournaments))
+
+                # Attach cache validators so an unchanged page is a 304
+                page_headers = headers
+                validators = _page_validators.get(more_url)
+                if validators:
+                    page_headers = dict(headers)
+                    if validators[0]:
+                        page_headers['If-None-Match'] = validators[0]
+                    if validators[1]:
+                        page_headers['If-Modified-Since'] = validators[1]
+
+                async with session.get(more_url, headers=page_headers) as more_response:
+                    more_status = more_response.status
+                    more_etag = more_response.headers.get('ETag')
+                    more_last_modified = more_response.headers.get('Last-Modified')
+                    more_body = await more_response.read() if more_status == 200 else b""
+                return more_url, more_status, more_etag, more_last_modified, more_body
+
+            logging.info(f"Fetching {MAX_PAGINATION_PAGES} additional pages of tournaments")
+            pages = await asyncio.gather(
+                *(fetch_page(page) for page in range(1, MAX_PAGINATION_PAGES + 1))
+            )
+
+            # Bodies arrive concurrently but are applied in page order so
+            # the entry offsets stay consistent
+            for page, (more_url, more_status, more_etag, more_last_modified, more_body) in enumerate(pages, 1):
+                if more_status == 304:
+                    cached_page = _page_results.get(more_url, [])
+                    logging.info(f"Page {page} unchanged, reusing {len(cached_page)} cached tournaments")
+                    if not cached_page:
+                        break
+                    # Shallow-copy so downstream flag updates don't leak
+                    # into the cached baseline
+                    tournaments.extend(dict(t) for t in cached_page)
+                elif more_status == 200:
+                    # Dedupe by URL instead of slicing by offset: correct
+                    # whether the endpoint returns just the next slice
+                    # (which the limit=50,N parameter suggests) or the
+                    # cumulative list, and it doesn't depend on row order
+                    page_tournaments = parse_tournament_page(more_body)
+                    seen_urls = {t["url"] for t in tournaments}
+                    more_tournaments = [t for t in page_tournaments if t["url"] not in seen_urls]
                     if not more_tournaments:
                         break
+                    if more_etag or more_last_modified:
+                        _page_validators[more_url] = (more_etag, more_last_modified)
+                        _page_results[more_url] = [dict(t) for t in more_tournaments]
                     tournaments.extend(more_tournaments)
                 else:
-                    logging.warning(f"Failed to load more tournaments: {more_response.status_code}")
+                    logging.warning(f"Failed to load more tournaments: {more_status}")
                     break
         else:
-            logging.error(f"Search form submission failed: {response.status_code}")
-            
+            logging.error(f"Search form submission failed: {status}")
+
         logging.info(f"Found {len(tournaments)} tournaments with fallback method")
         return tournaments
-    
+
     except Exception as e:
         logging.error(f"Error in fallback tournament fetch: {e}")
         return []
 
+# Debug screenshots force a repaint, a PNG encode in the browser and a
+# base64 hop over the WebDriver wire - a few hundred ms apiece - so the
+# hot path only takes them when explicitly enabled. The error-state
+# screenshot stays unconditional; that's the one worth having.
+DEBUG_SCREENSHOTS = os.getenv("BOT_DEBUG_SCREENSHOTS") == "1"
+
+def save_debug_screenshot(driver, filename):
+    """Save a screenshot only when debug screenshots are enabled"""
+    if DEBUG_SCREENSHOTS:
+        driver.save_screenshot(filename)
+        logging.info(f"Screenshot saved as {filename}")
+
 def fetch_tournaments():
     """Fetch tournaments from the website using Selenium to interact with search filters"""
     try:
-        driver = setup_webdriver()
+        driver = get_driver()
         if not driver:
             logging.error("Could not initialize webdriver. Aborting tournament fetch.")
             return []
         
         logging.info(f"Loading tournament search page: {TOURNAMENT_SEARCH_URL}")
         driver.get(TOURNAMENT_SEARCH_URL)
-        
-        # Add humanized waiting period after page load - use shorter delays
-        time.sleep(random.uniform(1, 2))
-        
+
         # Wait for the page to load - looking for the search form instead
         WebDriverWait(driver, PAGE_LOAD_WAIT).until(
             EC.presence_of_element_located((By.CLASS_NAME, "category-search"))
         )
         
         # Take a screenshot for debugging
-        driver.save_screenshot("search_page.png")
-        logging.info("Page screenshot saved as search_page.png")
+        save_debug_screenshot(driver, "search_page.png")
         
         # Check for and dismiss the classic version banner if present
         try:
@@ -262,17 +486,16 @@ def fetch_tournaments():
                 EC.presence_of_element_located((By.ID, "desktop-sunset"))
             )
             logging.info("Classic version banner found, attempting to dismiss it")
-            
-            # Short delay before interaction (more human-like)
-            time.sleep(random.uniform(1, 2))
-            
+
             # Try to find and click the "Ok" button
             ok_button = banner.find_element(By.CSS_SELECTOR, "a.btn.btn-primary")
             driver.execute_script("arguments[0].click();", ok_button)
             logging.info("Clicked 'Ok' button on classic version banner")
             
-            # Wait a moment for the banner to be removed
-            time.sleep(random.uniform(1, 2))
+            # Wait until the banner is actually gone rather than a fixed moment
+            WebDriverWait(driver, 5).until(
+                EC.invisibility_of_element_located((By.ID, "desktop-sunset"))
+            )
         except Exception as e:
             # Banner not found or couldn't be dismissed
             logging.info(f"Classic version banner not found or couldn't be dismissed: {e}")
@@ -280,11 +503,8 @@ def fetch_tournaments():
         # Click on the filter link to open the filter page
         try:
             # Take a screenshot to check that banner is gone
-            driver.save_screenshot("after_banner_dismissed.png")
-            
-            # Add reasonable delay before clicking filter link
-            time.sleep(random.uniform(REQUEST_COOLDOWN_MIN, REQUEST_COOLDOWN_MAX))
-            
+            save_debug_screenshot(driver, "after_banner_dismissed.png")
+
             # Try to find and click the filter link with multiple methods
             try:
                 filter_link = WebDriverWait(driver, 5).until(
@@ -293,151 +513,81 @@ def fetch_tournaments():
                 # Try JavaScript click first (more reliable with overlays)
                 driver.execute_script("arguments[0].click();", filter_link)
                 logging.info("Clicked on filter link using JavaScript")
-                
-                # Wait longer for the page to load (simulates human browsing)
-                time.sleep(PAGE_LOAD_WAIT)
-                
+
             except Exception as e:
                 logging.warning(f"JavaScript click failed: {e}")
-                
+
                 # Try alternate method with regular click
                 filter_link = driver.find_element(By.CLASS_NAME, "search-filter-anchor")
                 filter_link.click()
                 logging.info("Clicked on filter link using regular click")
-                
-                # Wait longer for the page to load
-                time.sleep(PAGE_LOAD_WAIT)
-                
+
         except Exception as e:
             logging.error(f"Failed to click filter link: {e}")
             # Try direct navigation instead
             driver.get("https://www.discgolfscene.com/tournaments/search-filter")
             logging.info("Navigated directly to filter page")
-            time.sleep(2) # Reduced delay
-        
-        # Wait for the filter form to load
+
+        # Wait for the filter form to load; this condition is what the
+        # fixed post-click sleeps were budgeting for
         try:
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "search-filter"))
             )
             
             # Take a screenshot of the filter form
-            driver.save_screenshot("filter_form.png")
-            logging.info("Filter form screenshot saved as filter_form.png")
+            save_debug_screenshot(driver, "filter_form.png")
             
-            # Step 1: First make sure USA is selected in the country dropdown
+            # Fill the entire form in one execute_script round trip.
+            # Every WebDriver call is a JSON-wire HTTP round trip to
+            # chromedriver, so the old per-field clear/send_keys flow
+            # (with per-character keystroke sleeps) cost dozens of round
+            # trips and several seconds of artificial delay; the hidden
+            # ZIP/lat/lng fields were being set by script anyway.
             try:
-                # Add a short delay before interacting with the form (more human-like but shorter)
-                time.sleep(random.uniform(0.5, 1))
-                
-                # Select the Country dropdown
-                country_select = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "filter_tournaments_country"))
-                )
-                
-                # Use JavaScript to set value to USA
-                driver.execute_script("arguments[0].value = 'USA';", country_select)
-                # Trigger change event to show state fields
-                driver.execute_script("arguments[0].dispatchEvent(new Event('change'));", country_select)
-                logging.info("Set country to USA")
-                
-                # Give the page a moment to update the form based on country selection
-                time.sleep(random.uniform(1, 2))
-                
-                # Take a screenshot after country selection
-                driver.save_screenshot("after_country_selection.png")
-                logging.info("Country selection screenshot saved")
-                
-                # Add another pause before state selection
-                time.sleep(random.uniform(1, 1.5))
-                
-                # Make sure "Any" is selected for state (default option)
-                state_select = driver.find_element(By.ID, "filter_usa_state")
-                driver.execute_script("arguments[0].value = '';", state_select)
-                driver.execute_script("arguments[0].dispatchEvent(new Event('change'));", state_select)
-                logging.info("Set state to Any")
-            except Exception as e:
-                logging.error(f"Failed to set country/state: {e}")
-            
-            # Step 2: Now handle the location section which should be visible since USA is selected
-            try:
-                # Add a short delay before location form interactions
-                time.sleep(random.uniform(1, 2))
-                
-                # Check if we need to show the location input first
-                location_display = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.ID, "location-display"))
-                )
-                
-                if location_display.is_displayed():
-                    # Click the change location link to show the input field
-                    change_location = location_display.find_element(By.CSS_SELECTOR, "a")
-                    driver.execute_script("arguments[0].click();", change_location)
-                    logging.info("Clicked 'Change location' link")
-                    time.sleep(random.uniform(1, 2))  # Wait for the location field to appear
-                
-                # Now find and set the location name/ZIP code
-                location_name = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "filter_location_name"))
+                # Wait for the country dropdown so the form is interactive
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.ID, "filter_tournaments_country"))
                 )
-                location_name.clear()
-                
-                # Type the ZIP code more like a human (character by character with slight delays)
-                for digit in ZIP_CODE:
-                    location_name.send_keys(digit)
-                    time.sleep(random.uniform(0.1, 0.3))  # Small delay between keystrokes
-                logging.info(f"Set location/ZIP to {ZIP_CODE}")
-                
-                # Wait for any autocomplete to process (more human-like behavior)
-                time.sleep(random.uniform(1.5, 2.5))
-                
-                # Set the hidden ZIP code field as well
-                driver.execute_script(f"document.getElementById('filter_location_zip').value = '{ZIP_CODE}';")
-                
-                # Set the latitude and longitude fields (these are required for the search to work correctly)
-                driver.execute_script("document.getElementById('filter_location_latitude').value = '39.846520';")
-                driver.execute_script("document.getElementById('filter_location_longitude').value = '-74.960981';")
-                logging.info("Set location coordinates for Echelon, NJ")
-                
-                # Add a short pause before setting distance
-                time.sleep(random.uniform(1, 2))
-                
-                # Step 3: Set the distance
-                distance_input = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "filter_location_distance"))
-                )
-                distance_input.clear()
-                
-                # Type the distance more like a human (character by character with slight delays)
-                for digit in SEARCH_DISTANCE:
-                    distance_input.send_keys(digit)
-                    time.sleep(random.uniform(0.1, 0.3))  # Small delay between keystrokes
-                logging.info(f"Set distance to {SEARCH_DISTANCE} miles")
-                
+
+                fill_form_js = """
+                    var zip = arguments[0], distance = arguments[1];
+                    var lat = arguments[2], lng = arguments[3];
+                    function setValue(id, value) {
+                        var el = document.getElementById(id);
+                        if (el) {
+                            el.value = value;
+                            el.dispatchEvent(new Event('change'));
+                        }
+                    }
+                    setValue('filter_tournaments_country', 'USA');
+                    setValue('filter_usa_state', '');
+                    var display = document.getElementById('location-display');
+                    if (display && display.offsetParent !== null) {
+                        var link = display.querySelector('a');
+                        if (link) { link.click(); }
+                    }
+                    setValue('filter_location_name', zip);
+                    setValue('filter_location_zip', zip);
+                    setValue('filter_location_latitude', lat);
+                    setValue('filter_location_longitude', lng);
+                    setValue('filter_location_distance', distance);
+                    var dateAll = document.getElementById('date-range-0');
+                    if (dateAll && !dateAll.checked) { dateAll.click(); }
+                """
+                driver.execute_script(fill_form_js, ZIP_CODE, SEARCH_DISTANCE, SEARCH_LATITUDE, SEARCH_LONGITUDE)
+                logging.info(f"Filled search form in one call: USA, ZIP {ZIP_CODE}, distance {SEARCH_DISTANCE} miles")
+
                 # Take a screenshot of the completed form
-                driver.save_screenshot("completed_form.png")
-                logging.info("Screenshot of completed form saved")
-            except Exception as e:
-                logging.error(f"Failed to set location/distance: {e}")
-            
-            # Make sure the "All upcoming" date range is selected
-            try:
-                # Add a short delay
-                time.sleep(random.uniform(1, 1.5))
-                
-                date_range_all = driver.find_element(By.ID, "date-range-0")
-                if not date_range_all.is_selected():
-                    driver.execute_script("arguments[0].click();", date_range_all)
-                    logging.info("Selected 'All upcoming' date range")
+                save_debug_screenshot(driver, "completed_form.png")
             except Exception as e:
-                logging.warning(f"Could not set date range: {e}")
-            
-            # Add another short delay before submitting (human-like pause before form submission)
+                logging.error(f"Failed to fill search form: {e}")
+
+            # Brief pause so any change handlers settle before submitting
             time.sleep(random.uniform(0.5, 1))
-            
+
             # Take a screenshot before submitting the form
-            driver.save_screenshot("before_submit.png")
-            logging.info("Form filled. Screenshot saved as before_submit.png")
+            save_debug_screenshot(driver, "before_submit.png")
             
             # Submit the form by clicking the search button
             try:
@@ -456,9 +606,8 @@ def fetch_tournaments():
                 except Exception as js_e:
                     logging.error(f"Failed to submit form: {js_e}")
             
-            # Wait longer for the results page to load - websites often delay search results intentionally
-            # to prevent scraping
-            time.sleep(PAGE_LOAD_WAIT * 1.5)
+            # Wait for the results page; the condition fires the moment
+            # the list is in the DOM, so no fixed pre-wait is needed
             try:
                 WebDriverWait(driver, 15).until(
                     EC.presence_of_element_located((By.ID, "tournaments-list"))
@@ -473,14 +622,23 @@ def fetch_tournaments():
             # Continue anyway to see if we can parse tournaments from current page
         
         # Take a screenshot of results
-        driver.save_screenshot("results_page.png")
-        logging.info("Results page screenshot saved as results_page.png")
+        save_debug_screenshot(driver, "results_page.png")
         
+        # Only the tournaments-list subtree matters; page_source would
+        # serialize the whole DOM (header, footer, scripts) over the
+        # WebDriver wire just for the parser to throw it away
+        def get_listing_html():
+            html = driver.execute_script(
+                "var el = document.getElementById('tournaments-list');"
+                "return el ? el.outerHTML : null;"
+            )
+            return html if html else driver.page_source
+
         # Parse the results
         tournaments = []
-        
+
         # Get the initial page of results
-        page_html = driver.page_source
+        page_html = get_listing_html()
         initial_tournaments = parse_tournament_page(page_html)
         logging.info(f"Initially found {len(initial_tournaments)} tournaments")
         tournaments.extend(initial_tournaments)
@@ -505,13 +663,20 @@ def fetch_tournaments():
                     time.sleep(wait_time)
                     
                     # Use JavaScript click for better reliability
+                    old_count = len(driver.find_elements(By.CSS_SELECTOR, ".tournament-list.list-record"))
                     driver.execute_script("arguments[0].click();", load_more_link)
-                    
-                    # Wait longer for new content to load
-                    time.sleep(PAGE_LOAD_WAIT)
-                    
+
+                    # Wait until new rows are actually appended instead of
+                    # sleeping a worst-case budget
+                    try:
+                        WebDriverWait(driver, 10).until(
+                            lambda d: len(d.find_elements(By.CSS_SELECTOR, ".tournament-list.list-record")) > old_count
+                        )
+                    except Exception:
+                        logging.info("No new tournaments appeared after clicking load more")
+
                     # Parse the newly loaded tournaments
-                    new_html = driver.page_source
+                    new_html = get_listing_html()
                     new_tournaments = parse_tournament_page(new_html, len(tournaments))
                     
                     if not new_tournaments:
@@ -540,47 +705,73 @@ def fetch_tournaments():
             logging.info(f"No 'load more' link or error occurred: {e}")
         
         logging.info(f"Found {len(tournaments)} tournaments total")
-        driver.quit()
+        # Keep the driver alive for the next cycle
         return tournaments
-        
+
     except Exception as e:
         logging.error(f"Error fetching tournaments: {e}")
         if 'driver' in locals() and driver:
             try:
                 driver.save_screenshot("error_state.png")
                 logging.info("Error state screenshot saved as error_state.png")
-                driver.quit()
             except:
                 pass
+        # The session may be wedged after an error; start fresh next run
+        discard_driver()
         return []
 
+# Only build soup objects for the tournament entry divs; the rest of the
+# listing page (nav, footer, scripts) never gets queried, so skipping it
+# at parse time cuts Tag allocations and parse CPU
+LISTING_STRAINER = SoupStrainer("div", class_=re.compile(r"\btournament-list\b"))
+
+# Listing-page selectors, precompiled once so the per-div loop skips
+# soupsieve's selector parsing on every iteration
+SEL_TOURNAMENT_DIV = soupsieve.compile(".tournament-list.list-record")
+SEL_LINK = soupsieve.compile("a")
+SEL_NAME = soupsieve.compile("span.name")
+SEL_INFO = soupsieve.compile("span.info")
+
+# One compiled pattern covers the listing date variants ("Sat, Mar 15,
+# 2025", "Sat-Sun, Mar 22-23, 2025", "March 15, 2025"): month word,
+# first day (ranges keep the start day), year. Replaces the chained
+# split/strptime attempts whose exception-driven fallbacks never
+# actually matched the range format the site uses.
+_DATE_RE = re.compile(r'\b([A-Z][a-z]{2})[a-z]*\.?\s+(\d{1,2})(?:\s*-\s*\d{1,2})?,\s*(\d{4})\b')
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# Registrant counts come as "12" or "12 / 72"; one pattern handles both
+_REG_RE = re.compile(r"(\d+)\s*(?:/\s*(\d+))?")
+# A future registration-open timestamp looks like "... at 7:00pm EDT"
+_REG_OPENS_RE = re.compile(r"\bat\b.*\b(?:EDT|EST)\b")
+
 def parse_tournament_page(html_content, existing_count=0):
     """Parse the tournament listings from the HTML content"""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml', parse_only=LISTING_STRAINER)
     
     tournaments = []
-    tournament_divs = soup.select(".tournament-list.list-record")
+    tournament_divs = SEL_TOURNAMENT_DIV.select(soup)
     
     # Skip already processed tournaments if we're loading more
     tournament_divs = tournament_divs[existing_count:] if existing_count > 0 else tournament_divs
     
-    # Current date for year handling
-    now = datetime.now()
-    
     logging.info(f"Parsing {len(tournament_divs)} tournament entries")
 
     for div in tournament_divs:
         try:
             # Extract URL from the <a> tag
-            link_tag = div.select_one("a")
+            link_tag = SEL_LINK.select_one(div)
             url = link_tag['href'] if link_tag and link_tag.has_attr('href') else "N/A"
             
             # Extract name
-            name_span = div.select_one("span.name")
+            name_span = SEL_NAME.select_one(div)
             name = name_span.text.strip() if name_span else "N/A"
             
             # Extract info spans for date, tier, etc.
-            info_spans = div.select("span.info")
+            info_spans = SEL_INFO.select(div)
             
             # Extract tier and date from the first info span
             date_text = ""
@@ -607,45 +798,17 @@ def parse_tournament_page(html_content, existing_count=0):
             
             # Parse date_text to get a standard format
             date = "N/A"
-            try:
-                # Handle different date formats
-                if "-" in date_text:  # Format like "Sat-Sun, Mar 22-23, 2025"
-                    date_parts = date_text.split(",")
-                    if len(date_parts) >= 2:
-                        month_day_year = date_parts[-1].strip()
-                        if "20" in month_day_year:  # Contains year
-                            # Try different formats
-                            try:
-                                date_obj = datetime.strptime(month_day_year, "%b %d, %Y")
-                                date = date_obj.strftime("%m/%d/%Y")
-                            except ValueError:
-                                # Try another format (handle cases like "Mar 22-23, 2025")
-                                # Extract just the month and year
-                                month = month_day_year.split(" ")[0]
-                                year = month_day_year.split(" ")[-1]
-                                # Use the first day of the month as an approximation
-                                try:
-                                    date_obj = datetime.strptime(f"{month} 1, {year}", "%b %d, %Y")
-                                    date = date_obj.strftime("%m/%d/%Y")
-                                except ValueError:
-                                    date = "N/A"
-                elif "," in date_text:  # Format like "Sat, Mar 15, 2025"
-                    date_parts = date_text.split(",")
-                    if len(date_parts) >= 2:
-                        month_day_year = ",".join(date_parts[1:]).strip()
-                        try:
-                            date_obj = datetime.strptime(month_day_year, " %b %d, %Y")
-                            date = date_obj.strftime("%m/%d/%Y")
-                        except ValueError:
-                            # Try alternative format
-                            try:
-                                date_obj = datetime.strptime(month_day_year, " %B %d, %Y")
-                                date = date_obj.strftime("%m/%d/%Y")
-                            except ValueError:
-                                date = "N/A"
-            except Exception as e:
-                logging.warning(f"Failed to parse date from '{date_text}': {e}")
-                date = "N/A"
+            date_obj = None
+            match = _DATE_RE.search(date_text)
+            if match:
+                month = _MONTHS.get(match.group(1))
+                if month:
+                    try:
+                        date_obj = datetime(int(match.group(3)), month, int(match.group(2)))
+                        date = date_obj.strftime("%m/%d/%Y")
+                    except ValueError as e:
+                        logging.warning(f"Failed to parse date from '{date_text}': {e}")
+                        date_obj = None
             
             # Extract location and registrants from the second info span
             location = "N/A"
@@ -653,49 +816,53 @@ def parse_tournament_page(html_content, existing_count=0):
             capacity = 0
             
             if info_spans and len(info_spans) > 1:
-                location_info = info_spans[1]
-                location_span = location_info.select_one("span")
-                if location_span:
-                    location = location_span.text.strip()
-                
-                # Look for registration numbers which are in format "##" or "## / ##"
-                user_group_icon = location_info.select_one("i.fa-user-group")
-                
-                if user_group_icon:
-                    # Find the <b> tag that follows the user-group icon
-                    reg_numbers_b = user_group_icon.find_next("b")
-                    if reg_numbers_b:
-                        reg_numbers = reg_numbers_b.text.strip()
-                        if "/" in reg_numbers:
-                            reg_parts = reg_numbers.split("/")
-                            try:
-                                registrants = int(reg_parts[0].strip())
-                                capacity = int(reg_parts[1].strip())
-                            except ValueError:
-                                registrants = 0
-                                capacity = 0
-                        else:
-                            try:
-                                registrants = int(reg_numbers.strip())
-                            except ValueError:
-                                registrants = 0
+                # One pass over the direct children: the first <span> is the
+                # location, and the <b> right after the fa-user-group icon
+                # holds the "##" or "## / ##" counts. A fa-flying-disc icon
+                # with its own <b> may follow; tracking which icon came last
+                # keeps that count from being mistaken for registrants.
+                reg_numbers_b = None
+                after_user_group = False
+                for child in info_spans[1].children:
+                    child_name = getattr(child, "name", None)
+                    if child_name == "span" and location == "N/A":
+                        location = child.get_text(strip=True)
+                    elif child_name == "i":
+                        after_user_group = "fa-user-group" in child.get("class", ())
+                    elif child_name == "b" and after_user_group:
+                        reg_numbers_b = child
+                        break
+
+                if reg_numbers_b is not None:
+                    reg_match = _REG_RE.search(reg_numbers_b.text)
+                    if reg_match:
+                        registrants = int(reg_match.group(1))
+                        if reg_match.group(2):
+                            capacity = int(reg_match.group(2))
             
             # Check if registration is open - tournaments with upcoming registration will have a timestamp
             registration_open = True  # Default to assume open
             if info_spans and len(info_spans) > 2:
-                reg_info = info_spans[2].text.strip()
-                if "at" in reg_info and ("EDT" in reg_info or "EST" in reg_info):  # Registration opens in the future
+                reg_info = info_spans[2].text
+                if _REG_OPENS_RE.search(reg_info):  # Registration opens in the future
                     registration_open = False
             
             tournaments.append({
                 "name": name,
                 "url": url,
                 "registration_open": registration_open,
+                # Prebuilt display string so the embed loops don't re-branch
+                "registration_open_str": "Yes" if registration_open else "No",
                 "location": location,
                 "date": date,
+                # Already-parsed datetime so downstream checks skip re-parsing
+                "_date_obj": date_obj,
                 "registrants": registrants,
                 "capacity": capacity,
-                "tier": tier
+                "tier": tier,
+                # Identity key, built while the fields are at hand so the
+                # matching pass doesn't reassemble it per lookup
+                "_key": (name, date, location)
             })
         except Exception as e:
             logging.error(f"Error parsing tournament entry: {e}")
@@ -703,8 +870,13 @@ def parse_tournament_page(html_content, existing_count=0):
 
     return tournaments
 
+# Hash of the last body we uploaded; most ticks scrape an identical list
+# and can skip the PUT round-trip entirely
+_last_body_hash = None
+
 def save_tournaments_to_s3(tournaments):
-    """Save tournaments to S3 bucket"""
+    """Save tournaments to S3 bucket, skipping the upload when unchanged"""
+    global _last_body_hash
     if not tournaments:
         logging.error("No tournaments to save. Skipping S3 upload.")
         return False
@@ -716,76 +888,153 @@ def save_tournaments_to_s3(tournaments):
                 return obj.isoformat()  # Convert datetime to ISO 8601 string
             raise TypeError(f"Type {type(obj)} not serializable")
 
-        s3.put_object(
+        # Prefer orjson (C encoder, native datetime support) when available.
+        # Write compact JSON - indentation only inflated the payload on
+        # every PUT and nothing human reads the blob in S3
+        if orjson is not None:
+            body = orjson.dumps(tournaments)
+        else:
+            # ensure_ascii=False keeps non-ASCII names/locations as UTF-8
+            # instead of six-byte \uXXXX escapes, matching orjson's output
+            body = json.dumps(tournaments, separators=(',', ':'), ensure_ascii=False, default=serialize)
+
+        body_bytes = body if isinstance(body, bytes) else body.encode('utf-8')
+        # Hash the uncompressed JSON so the skip check is independent of
+        # compression details
+        body_hash = hashlib.blake2b(body_bytes, digest_size=16).digest()
+        if body_hash == _last_body_hash:
+            logging.info("Tournaments unchanged, skipping S3 upload")
+            return True
+
+        put_response = s3.put_object(
             Bucket=S3_BUCKET_NAME,
             Key=S3_FILE_KEY,
-            Body=json.dumps(tournaments, indent=4, default=serialize),  # Use custom serializer
-            ContentType="application/json"
+            # JSON state compresses 5-10x, shrinking both the PUT and the
+            # next tick's GET
+            Body=gzip.compress(body_bytes, compresslevel=6),
+            ContentType="application/json",
+            ContentEncoding="gzip"
         )
+
+        # Keep the read cache coherent so the next tick revalidates
+        # against what we just wrote instead of re-downloading it
+        global _cached_tournaments, _cached_etag
+        _cached_tournaments = tournaments
+        _cached_etag = put_response.get('ETag')
+        _last_body_hash = body_hash
         return True
     except ClientError as e:
         logging.error(f'Error saving tournaments to S3: {e}')
         return False
 
-async def save_tournaments_async(tournaments):
-    """Async wrapper for save_tournaments to avoid blocking Discord"""
-    loop = asyncio.get_running_loop()
-    saved_tournaments = await loop.run_in_executor(thread_pool, load_tournaments_from_s3)
-    logging.info(f"Loaded {len(saved_tournaments)} saved tournaments")
+async def save_tournaments_async(tournaments, saved_task=None):
+    """Classify tournaments against saved state and kick off the S3 save
 
-    # Identify new tournaments (unique by name, date, and location)
-    new_tournaments = [
-        t for t in tournaments if not any(
-            t["name"] == saved["name"] and
-            t["date"] == saved["date"] and
-            t["location"] == saved["location"]
-            for saved in saved_tournaments
-        )
-    ]
+    Accepts an optional already-started load task so the S3 GET can
+    overlap the scrape upstream. Returns the notification lists plus
+    the pending S3 save task, letting the caller overlap the PUT with
+    the Discord sends and await it at the end of the tick.
+    """
+    # to_thread keeps boto3's blocking I/O off the event loop
+    if saved_task is None:
+        saved_task = asyncio.create_task(asyncio.to_thread(load_tournaments_from_s3))
+    saved_tournaments = await saved_task
+    logging.info(f"Loaded {len(saved_tournaments)} saved tournaments")
 
-    # Initialize flags for new tournaments
-    for tournament in tournaments:
-        matching_saved = next(
-            (saved for saved in saved_tournaments if 
-             saved["name"] == tournament["name"] and 
-             saved["date"] == tournament["date"] and 
-             saved["location"] == tournament["location"]), 
-            None
-        )
-        if matching_saved:
-            tournament["registration_closing_sent"] = matching_saved.get("registration_closing_sent", False)
-            tournament["registration_filling_sent"] = matching_saved.get("registration_filling_sent", False)
-        else:
-            tournament["registration_closing_sent"] = False
-            tournament["registration_filling_sent"] = False
+    # Index saved tournaments by their identity key so each current
+    # tournament is matched with one dict lookup instead of a full scan.
+    # The key survives the JSON round trip as a list; older saved data
+    # predating the precomputed key gets it rebuilt from the fields.
+    saved_index = {
+        tuple(saved["_key"]) if "_key" in saved
+        else (saved["name"], saved["date"], saved["location"]): saved
+        for saved in saved_tournaments
+    }
 
-    # Check for registration changes
+    # Classify every tournament in one linear pass: new vs known, newly
+    # opened registration, and notification-flag carry-over all come from
+    # the same single index lookup
+    new_tournaments = []
     registration_opened = []
     closing_soon = []
     filling_up = []
 
-    # Find tournaments where registration has newly opened
     for current in tournaments:
-        matching_saved = next(
-            (saved for saved in saved_tournaments if 
-             saved["name"] == current["name"] and 
-             saved["date"] == current["date"] and 
-             saved["location"] == current["location"]), 
-            None
-        )
-        
-        if matching_saved and not matching_saved.get("registration_open", False) and current.get("registration_open", True):
-            registration_opened.append(current)
+        matching_saved = saved_index.get(current["_key"])
+
+        if matching_saved is None:
+            new_tournaments.append(current)
+            current["registration_closing_sent"] = False
+            current["registration_filling_sent"] = False
+        else:
+            current["registration_closing_sent"] = matching_saved.get("registration_closing_sent", False)
+            current["registration_filling_sent"] = matching_saved.get("registration_filling_sent", False)
+            if not matching_saved.get("registration_open", False) and current.get("registration_open", True):
+                registration_opened.append(current)
 
-    # Use the DetailWorker to fetch additional tournament details asynchronously
-    # This doesn't block Discord's heartbeat because it uses a separate executor
-    detail_worker = DetailWorker(thread_pool, max_concurrent=2)
+    # Use the shared DetailWorker to fetch additional tournament details
+    # asynchronously; a tick that overlaps the previous one joins its
+    # in-flight fetches instead of re-requesting the same URLs
     closing_soon, filling_up = await detail_worker.enrich_tournaments(tournaments)
 
-    # Save the updated tournaments list back to S3
-    await loop.run_in_executor(thread_pool, lambda: save_tournaments_to_s3(tournaments))
+    # Start the S3 save but don't wait for it; the caller overlaps it
+    # with the Discord sends and awaits it before the tick ends
+    save_task = asyncio.create_task(asyncio.to_thread(save_tournaments_to_s3, tournaments))
 
-    return new_tournaments, registration_opened, closing_soon, filling_up
+    return new_tournaments, registration_opened, closing_soon, filling_up, save_task
+
+# Discord accepts up to 10 embeds per message, and roughly 5 messages
+# per 5 seconds per channel; pack embeds into as few messages as
+# possible and pace bursts of messages against the channel bucket
+DISCORD_EMBEDS_PER_MESSAGE = 10
+DISCORD_SEND_BURST = 5
+DISCORD_BURST_INTERVAL = 5
+
+# Description templates for the notification embeds, hoisted so the
+# loops in check_tournaments only fill in per-tournament values
+NEW_TOURNAMENT_TEMPLATE = (
+    "[{name}]({url})\n\n"
+    "**Location:** {location}\n"
+    "**Date:** {date}\n"
+    "**Registrants:** {registrants}\n"
+    "**Registration Open:** {registration_open_str}"
+)
+REGISTRATION_OPENED_TEMPLATE = NEW_TOURNAMENT_TEMPLATE
+CLOSING_SOON_TEMPLATE = (
+    "[{name}]({url})\n\n"
+    "**Location:** {location}\n"
+    "**Tournament Date:** {date}\n"
+    "**Registration Closes:** {closing_text}"
+)
+FILLING_UP_TEMPLATE = (
+    "[{name}]({url})\n\n"
+    "**Location:** {location}\n"
+    "**Date:** {date}\n"
+    "**Registrants:** {registrants} / {capacity}"
+)
+
+def make_embed(template, title, color, tournament, include_tier=False):
+    """Build one notification embed from a hoisted description template"""
+    embed = discord.Embed(
+        title=title,
+        description=template.format_map(tournament),
+        color=color
+    )
+    if include_tier and tournament.get('tier'):
+        embed.add_field(name="Tier", value=tournament['tier'], inline=False)
+    return embed
+
+async def send_embeds(channel, embeds):
+    """Send embeds packed into multi-embed messages, paced per channel bucket"""
+    messages = [
+        embeds[i:i + DISCORD_EMBEDS_PER_MESSAGE]
+        for i in range(0, len(embeds), DISCORD_EMBEDS_PER_MESSAGE)
+    ]
+    for i in range(0, len(messages), DISCORD_SEND_BURST):
+        burst = messages[i:i + DISCORD_SEND_BURST]
+        await asyncio.gather(*(channel.send(embeds=message) for message in burst))
+        if i + DISCORD_SEND_BURST < len(messages):
+            await asyncio.sleep(DISCORD_BURST_INTERVAL)
 
 @client.event
 async def on_ready():
@@ -804,21 +1053,42 @@ def jittered_hours(hours=8):
     jitter = base_minutes * 0.25  # 25% jitter
     return base_minutes + random.uniform(-jitter, jitter)
 
+# Back off the poll interval while nothing is changing. After a few
+# quiet ticks in a row the interval doubles up to a cap, and any tick
+# that produces a notification resets it, so freshness is unchanged
+# when something is actually happening.
+_consecutive_no_change = 0
+BACKOFF_QUIET_TICKS = 3
+BASE_INTERVAL_HOURS = 12
+MAX_INTERVAL_HOURS = 24
+
 @tasks.loop(hours=12)  # Run every 12 hours instead of every hour
 async def check_tournaments():
+    global _consecutive_no_change
     try:
         logging.info("Checking for new tournaments...")
-        
+
+        # Start the S3 load now so it overlaps the scrape instead of
+        # running after it
+        saved_task = asyncio.create_task(asyncio.to_thread(load_tournaments_from_s3))
+
         # Use async version of the tournament fetching to avoid blocking heartbeats
         tournaments = await fetch_tournaments_async()
-        
+
         # Handle errors gracefully
         if not tournaments:
             logging.warning("No tournaments fetched. Skipping notification cycle.")
+            await saved_task  # Let the load finish quietly
             return
-            
+
         # Use async version of save_tournaments to avoid blocking
-        new_tournaments, registration_opened, closing_soon, filling_up = await save_tournaments_async(tournaments)
+        new_tournaments, registration_opened, closing_soon, filling_up, save_task = await save_tournaments_async(tournaments, saved_task)
+
+        # Track quiet ticks for the backoff schedule below
+        if new_tournaments or registration_opened or closing_soon or filling_up:
+            _consecutive_no_change = 0
+        else:
+            _consecutive_no_change += 1
 
         logging.info(f"Found {len(new_tournaments)} new tournaments")
         logging.info(f"Found {len(registration_opened)} tournaments with newly opened registration")
@@ -828,80 +1098,75 @@ async def check_tournaments():
         channel = client.get_channel(CHANNEL_ID)
         if not channel:
             logging.error(f"Could not find Discord channel with ID {CHANNEL_ID}")
+            await save_task  # Still persist the updated state
             return
 
-        # Send messages for new tournaments
+        # Build embeds for new tournaments, then send them concurrently
+        new_embeds = []
         for tournament in new_tournaments:
             logging.info(f"New tournament: {tournament['name']}")
+            new_embeds.append(make_embed(
+                NEW_TOURNAMENT_TEMPLATE, "🚨 New Local Tournament 🚨",
+                discord.Color.blue(), tournament, include_tier=True
+            ))
 
-            # Inside the loop where we create the embed
-            embed = discord.Embed(
-                title="🚨 New Local Tournament 🚨",
-                description=f"[{tournament['name']}]({tournament['url']})\n\n"
-                           f"**Location:** {tournament['location']}\n"
-                           f"**Date:** {tournament['date']}\n"
-                           f"**Registrants:** {tournament['registrants']}\n"
-                           f"**Registration Open:** {'Yes' if tournament['registration_open'] else 'No'}",
-                color=discord.Color.blue()
-            )
-
-            if tournament['tier']:
-                embed.add_field(name="Tier", value=tournament['tier'], inline=False)
+        await send_embeds(channel, new_embeds)
 
-            await channel.send(embed=embed)
-            await asyncio.sleep(0.5)  # Small delay between messages to avoid rate limits
-
-        # Send messages for tournaments with newly opened registration
+        # Build embeds for tournaments with newly opened registration
+        opened_embeds = []
         for tournament in registration_opened:
             logging.info(f"Registration opened: {tournament['name']}")
+            opened_embeds.append(make_embed(
+                REGISTRATION_OPENED_TEMPLATE, "📖 Registration Open 📖",
+                discord.Color.green(), tournament, include_tier=True
+            ))
+
+        await send_embeds(channel, opened_embeds)
 
-            embed = discord.Embed(
-                title="📖 Registration Open 📖",
-                description=f"[{tournament['name']}]({tournament['url']})\n\n"
-                        f"**Location:** {tournament['location']}\n"
-                        f"**Date:** {tournament['date']}\n"
-                        f"**Registrants:** {tournament['registrants']}\n"
-                        f"**Registration Open:** {'Yes' if tournament['registration_open'] else 'No'}",
-                color=discord.Color.green()
+        # Build embeds for closing soon
+        closing_embeds = [
+            make_embed(
+                CLOSING_SOON_TEMPLATE, "⏳ Registration Closing Soon ⏳",
+                discord.Color.orange(), tournament
             )
-            if tournament['tier']:
-                embed.add_field(name="Tier", value=tournament['tier'], inline=False)
-            
-            await channel.send(embed=embed)
-            await asyncio.sleep(0.5)  # Small delay between messages
-
-        # Send messages for closing soon
-        for tournament in closing_soon:
-            registration_closing_message = tournament.get('closing_text', 'N/A')
-            embed = discord.Embed(
-                title="⏳ Registration Closing Soon ⏳",
-                description=f"[{tournament['name']}]({tournament['url']})\n\n"
-                        f"**Location:** {tournament['location']}\n"
-                        f"**Tournament Date:** {tournament['date']}\n"
-                        f"**Registration Closes:** {registration_closing_message}",
-                color=discord.Color.orange()
+            for tournament in closing_soon
+        ]
+
+        await send_embeds(channel, closing_embeds)
+
+        # Build embeds for filling up
+        filling_embeds = [
+            make_embed(
+                FILLING_UP_TEMPLATE, "🚨 Registration Filling Up 🚨",
+                discord.Color.red(), tournament
             )
-            await channel.send(embed=embed)
-            await asyncio.sleep(0.5)  # Small delay between messages
-
-        # Send messages for filling up
-        for tournament in filling_up:
-            embed = discord.Embed(
-                title="🚨 Registration Filling Up 🚨",
-                description=f"[{tournament['name']}]({tournament['url']})\n\n"
-                        f"**Location:** {tournament['location']}\n"
-                        f"**Date:** {tournament['date']}\n"
-                        f"**Registrants:** {tournament['registrants']} / {tournament['capacity']}",
-                color=discord.Color.red()
+            for tournament in filling_up
+        ]
+
+        await send_embeds(channel, filling_embeds)
+
+        # The S3 PUT has been running alongside the sends; make sure it
+        # finished before this tick is considered done
+        await save_task
+
+        # Schedule the next run with jitter, doubling the interval up to
+        # the cap once enough consecutive ticks have produced no changes
+        interval_hours = BASE_INTERVAL_HOURS
+        if _consecutive_no_change >= BACKOFF_QUIET_TICKS:
+            interval_hours = min(
+                MAX_INTERVAL_HOURS,
+                BASE_INTERVAL_HOURS * 2 ** (_consecutive_no_change - BACKOFF_QUIET_TICKS + 1)
             )
-            await channel.send(embed=embed)
-            await asyncio.sleep(0.5)  # Small delay between messages
-        
-        # Add jitter to next run time to avoid predictable patterns
-        # that might trigger rate limiting detection
-        next_run = jittered_hours(12)  # 12 hours +/- 25% jitter
-        check_tournaments.change_interval(minutes=int(next_run))
-        logging.info(f"Next check scheduled in {next_run/60:.1f} hours")
+        next_run = jittered_hours(interval_hours)
+        # change_interval restarts the loop's internal sleep bookkeeping;
+        # skip it when the new interval is within a few minutes of the
+        # current one - the old value is just as jittered
+        current_minutes = check_tournaments.hours * 60 + check_tournaments.minutes
+        if abs(int(next_run) - current_minutes) > 5:
+            check_tournaments.change_interval(minutes=int(next_run))
+            logging.info(f"Next check scheduled in {next_run/60:.1f} hours ({_consecutive_no_change} quiet ticks)")
+        else:
+            logging.info(f"Keeping current interval of {current_minutes/60:.1f} hours ({_consecutive_no_change} quiet ticks)")
         
     except Exception as e:
         logging.error(f"Error in check_tournaments task: {e}", exc_info=True)
@@ -912,5 +1177,11 @@ async def check_tournaments():
         check_tournaments.change_interval(minutes=int(next_run))
         logging.info(f"Error occurred. Backing off - next check in {next_run/60:.1f} hours")
 
+@check_tournaments.before_loop
+async def before_check_tournaments():
+    # Don't let a tick race the gateway handshake if the task is ever
+    # started before on_ready
+    await client.wait_until_ready()
+
 # Run the bot
 client.run(TOKEN)